@@ -1,11 +1,14 @@
 """3-stage LLM Council orchestration."""
 
+import logging
 from typing import Any, Dict, List, Tuple
 
 from .config import CHAIRMAN_MODEL, COUNCIL_MODELS
 from .deep_research import perform_deep_research
 from .openrouter import query_model, query_models_parallel
-from .retrieval import fetch_context_items
+from .retrieval import ContextItem, fetch_context_items
+
+logger = logging.getLogger(__name__)
 
 
 async def stage1_collect_responses(
@@ -41,7 +44,7 @@ async def stage1_collect_responses(
                 # Optionally, we could merge the deep research context into the main context items
                 # but for now let's keep it simple. The answer already contains citations.
             except Exception as e:
-                print(f"Deep research failed: {e}")
+                logger.warning("Deep research failed: %s", e)
                 responses[model] = None
 
     # Format results
@@ -52,11 +55,11 @@ async def stage1_collect_responses(
                 {"model": model, "response": response.get("content", "")}
             )
 
-    return stage1_results, context_items
+    return stage1_results, [item.to_dict() for item in context_items]
 
 
 def _build_stage1_messages(
-    user_query: str, context_items: List[Dict[str, Any]]
+    user_query: str, context_items: List[ContextItem]
 ) -> List[Dict[str, str]]:
     """
     Build the chat messages for Stage 1, injecting fresh context when available.
@@ -96,14 +99,14 @@ USER QUESTION:
     ]
 
 
-def _format_context_item(idx: int, item: Dict[str, Any]) -> str:
+def _format_context_item(idx: int, item: ContextItem) -> str:
     """Represent a retrieved snippet with metadata for the prompt."""
-    title = item.get("title") or "Untitled"
-    source = item.get("source") or "Unknown source"
-    summary = item.get("summary") or ""
-    content = item.get("content") or ""
-    published_at = item.get("published_at") or "Unknown date"
-    url = item.get("url") or "No URL"
+    title = item.title or "Untitled"
+    source = item.source or "Unknown source"
+    summary = item.summary or ""
+    content = item.content or ""
+    published_at = item.published_at or "Unknown date"
+    url = item.url or "No URL"
     lines = [
         f"[Source #{idx}] {title} — {source}",
         f"Published: {published_at}",
@@ -8,11 +8,26 @@ from typing import List, Dict, Any
 import uuid
 import json
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 
-from . import storage
+from . import retrieval, storage
 from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage2_collect_rankings, stage3_synthesize_final, calculate_aggregate_rankings
 
-app = FastAPI(title="LLM Council API")
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled connections held by the retrieval client on shutdown."""
+    yield
+    await retrieval.aclose()
+
+
+app = FastAPI(title="LLM Council API", lifespan=lifespan)
 
 # Enable CORS for local development
 app.add_middleware(
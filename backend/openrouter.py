@@ -1,11 +1,14 @@
 """OpenRouter API client for making LLM requests."""
 
+import logging
 from typing import Any, Dict, List, Optional
 
 import httpx
 
 from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
 
+logger = logging.getLogger(__name__)
+
 
 async def query_model(
     model: str,
@@ -51,7 +54,7 @@ async def query_model(
             }
 
     except Exception as e:
-        print(f"Error querying model {model}: {e}")
+        logger.warning("Error querying model %s: %s", model, e)
         return None
 
 
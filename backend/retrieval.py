@@ -3,17 +3,38 @@
 from __future__ import annotations
 
 import asyncio
-import calendar
+import copy
+import functools
+import hashlib
+import heapq
+import html
+import importlib.util
+import io
+import logging
+import math
+import re
 import time
-import xml.etree.ElementTree as ET
+import weakref
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, List, Optional
-from urllib.parse import quote_plus
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit, urlunsplit
 
 import feedparser
 import httpx
 
+try:  # orjson parses API payloads straight from bytes, several times faster
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    from json import loads as _json_loads
+
+try:  # lxml is an optional C-accelerated drop-in for ElementTree
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - depends on installed extras
+    import xml.etree.ElementTree as ET
+
 from .config import (
     ARXIV_API_URL,
     GITHUB_API_URL,
@@ -23,7 +44,75 @@ from .config import (
     TECH_RSS_FEEDS,
 )
 
-ContextItem = Dict[str, Any]
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class ContextItem:
+    """A retrieved snippet from one of the external providers."""
+
+    provider: str
+    source: str
+    title: str
+    summary: str
+    url: Optional[str]
+    published_at: str
+    content: str
+    metadata: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form; ``metadata`` is only present when set."""
+        data: Dict[str, Any] = {
+            "provider": self.provider,
+            "source": self.source,
+            "title": self.title,
+            "summary": self.summary,
+            "url": self.url,
+            "published_at": self.published_at,
+            "content": self.content,
+        }
+        if self.metadata:
+            data["metadata"] = self.metadata
+        return data
+
+
+class _BloomFilter:
+    """
+    Fixed-size probabilistic set: membership tests may return false positives
+    at roughly ``error_rate`` but never false negatives.
+    """
+
+    __slots__ = ("_bits", "_size", "_hashes")
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._size = size
+        self._hashes = max(1, round(size / capacity * math.log(2)))
+        self._bits = bytearray((size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        # Double hashing over one 128-bit digest stands in for k hash functions
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for idx in range(self._hashes):
+            yield (first + idx * second) % self._size
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+# Normalized feed entry: (title, summary_html, link, published, title_lc,
+# summary_lc), the last two being lowercased UTF-8 computed once per parse
+FeedEntry = Tuple[str, str, Optional[str], Optional[str], bytes, bytes]
+# Parsed feed: (feed_title, entries)
+ParsedFeed = Tuple[Optional[str], List[FeedEntry]]
 
 RSS_REQUEST_HEADERS = {
     "User-Agent": "llm-council/1.0 (+https://github.com/varbhar/llm-council)",
@@ -36,51 +125,423 @@ PROCEEDINGS_FEEDS = [
     {"provider": "icml", "url": "https://proceedings.mlr.press/rss.xml"},
 ]
 
-async def fetch_context_items(query: str, limit: int = 8) -> List[ContextItem]:
+# Query-string tail shared by every arXiv search; only the query and the
+# result count vary per call
+_ARXIV_STATIC_QS = "&" + urlencode(
+    {"start": 0, "sortBy": "submittedDate", "sortOrder": "descending"}
+)
+
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_ATOM_FEED_TAG = f"{{{_ATOM_NS}}}feed"
+_ATOM_ENTRY_TAG = f"{{{_ATOM_NS}}}entry"
+_ATOM_TITLE_TAG = f"{{{_ATOM_NS}}}title"
+_RSS_CONTENT_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_DATE_TAG = "{http://purl.org/dc/elements/1.1/}date"
+
+# Aggregated results per normalized query token set, reused for follow-ups
+# that narrow an earlier query: tokens -> (expires_at, items newest first)
+_query_prefix_cache: Dict[FrozenSet[str], Tuple[float, List[ContextItem]]] = {}
+_QUERY_CACHE_TTL = 600
+_QUERY_CACHE_MAX_ENTRIES = 256
+_TOKEN_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "are", "about", "for", "from", "how", "in", "is",
+        "it", "of", "on", "or", "the", "to", "what", "whats", "with",
+    }
+)
+
+# Keep this many merged candidates per requested item, so the query prefix
+# cache has headroom to answer narrower follow-ups
+_CONTEXT_OVERSAMPLE = 2
+
+# Dedup keys of every item returned so far, so callers can ask for unseen
+# items only; ~2.4MB of bits for a million URLs instead of a dict of strings
+_SEEN_URLS = _BloomFilter(capacity=1_000_000, error_rate=1e-4)
+
+# Query parameters that only track the referrer and never change the page
+_TRACKING_PARAMS = frozenset({"ref", "ref_src", "ref_url", "fbclid", "gclid"})
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Shared HTTP clients so every fetcher reuses pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per call. Clients are bound to
+# the event loop that created them, so keep one per running loop.
+_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> client
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _log_http1_fallback() -> None:
+    # Runs once per process: at import time logging is not configured yet,
+    # and clients are created per event loop
+    logger.info("h2 is not installed; retrieval requests will use HTTP/1.1")
+
+
+async def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        if not _HTTP2_AVAILABLE:
+            _log_http1_fallback()
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+            headers={"User-Agent": "llm-council/1.0"},
+        )
+        _CLIENTS[loop] = client
+    return client
+
+
+async def aclose() -> None:
+    """Close the current event loop's HTTP client (call on application shutdown)."""
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# Cap simultaneous requests per host, so one slow or rate-limited provider
+# cannot hold slots the others need, and back off on transient failures.
+# Semaphores bind to the loop that first waits on them, so keep a set per loop.
+_HOST_SEMAPHORES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_HOST_CONCURRENCY = 8
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_MIN_WAIT = 0.5
+_RETRY_MAX_WAIT = 4.0
+
+
+async def _get(client: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+    """GET ``url`` under its host's concurrency cap, retrying 429/5xx responses."""
+    loop = asyncio.get_running_loop()
+    host_sems: Dict[str, asyncio.Semaphore] = _HOST_SEMAPHORES.get(loop)
+    if host_sems is None:
+        host_sems = _HOST_SEMAPHORES[loop] = {}
+    host = urlsplit(url).netloc
+    sem = host_sems.get(host)
+    if sem is None:
+        sem = host_sems[host] = asyncio.Semaphore(_HOST_CONCURRENCY)
+    delay = _RETRY_MIN_WAIT
+    for attempt in range(1, _RETRY_ATTEMPTS + 1):
+        async with sem:
+            response = await client.get(url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+            return response
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _RETRY_MAX_WAIT)
+    return response
+
+
+def _evict_to_capacity(
+    cache: Dict[Any, Any], max_entries: int, now: Optional[float] = None
+) -> None:
+    """
+    Make room for one more entry in an insertion-ordered cache.
+
+    With ``now``, values are ``(expires_at, ...)`` tuples and expired entries
+    are dropped first; the oldest insertions go next. Callers pop a key before
+    re-inserting it so that insertion order tracks recency.
+    """
+    if len(cache) < max_entries:
+        return
+    if now is not None:
+        for stale in [key for key, value in cache.items() if value[0] <= now]:
+            del cache[stale]
+    while len(cache) >= max_entries:
+        del cache[next(iter(cache))]
+
+
+# Per-feed validators and parsed entries for conditional GETs, kept in LRU
+# order: url -> {"etag": ..., "last_modified": ..., "feed": ParsedFeed}.
+# Only the event loop thread touches it, so no lock is needed.
+_feed_cache: Dict[str, Dict[str, Any]] = {}
+_FEED_CACHE_MAX_ENTRIES = 256
+
+
+async def _fetch_feed(client: httpx.AsyncClient, url: str, label: str) -> ParsedFeed:
+    """Fetch and parse a feed, reusing the cached parse when it answers 304."""
+    headers = dict(RSS_REQUEST_HEADERS)
+    cached = _feed_cache.get(url)
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = await _get(client, url, headers=headers)
+    if response.status_code == 304 and cached:
+        _feed_cache[url] = _feed_cache.pop(url, cached)  # mark most recently used
+        return cached["feed"]
+
+    # Feed parsing is synchronous CPU work; keep it off the event loop
+    feed = await asyncio.to_thread(_parse_feed, response.content, url, label)
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    _feed_cache.pop(url, None)
+    if etag or last_modified:
+        _evict_to_capacity(_feed_cache, _FEED_CACHE_MAX_ENTRIES)
+        _feed_cache[url] = {"etag": etag, "last_modified": last_modified, "feed": feed}
+    return feed
+
+
+# GitHub repository search results, reused across queries because the search
+# endpoint has a far tighter rate limit than the rest of the REST API:
+# (query, max_repos) -> (expires_at, repos)
+_github_search_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+_GITHUB_SEARCH_TTL = 600
+# Latest-release payloads kept for conditional GETs, in LRU order:
+# url -> {"etag": ..., "release": ...}. 304s do not count against the quota.
+_github_release_cache: Dict[str, Dict[str, Any]] = {}
+_GITHUB_CACHE_MAX_ENTRIES = 256
+
+
+async def _search_github_repos(
+    client: httpx.AsyncClient,
+    query: str,
+    max_repos: int,
+    headers: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    """Return up to ``max_repos`` recently updated repositories matching ``query``."""
+    key = (query, max_repos)
+    now = time.monotonic()
+    cached = _github_search_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    params = {
+        "q": query,
+        "sort": "updated",
+        "order": "desc",
+        "per_page": max_repos,
+    }
+    response = await _get(
+        client, f"{GITHUB_API_URL}/search/repositories", params=params, headers=headers
+    )
+    response.raise_for_status()
+    repos = (_json_loads(response.content).get("items") or [])[:max_repos]
+
+    _github_search_cache.pop(key, None)
+    _evict_to_capacity(_github_search_cache, _GITHUB_CACHE_MAX_ENTRIES, now)
+    _github_search_cache[key] = (now + _GITHUB_SEARCH_TTL, repos)
+    return repos
+
+
+async def _fetch_github_release(
+    client: httpx.AsyncClient, url: str, headers: Dict[str, str]
+) -> Optional[Dict[str, Any]]:
+    """Fetch a latest-release payload, or None when the repo has no releases."""
+    cached = _github_release_cache.get(url)
+    if cached:
+        headers = {**headers, "If-None-Match": cached["etag"]}
+
+    response = await _get(client, url, headers=headers)
+    if response.status_code == 304 and cached:
+        _github_release_cache[url] = _github_release_cache.pop(url, cached)
+        return cached["release"]
+    if response.status_code == 404:
+        return None  # repository has no published releases
+    response.raise_for_status()
+
+    release = _json_loads(response.content)
+    etag = response.headers.get("etag")
+    _github_release_cache.pop(url, None)
+    if etag:
+        _evict_to_capacity(_github_release_cache, _GITHUB_CACHE_MAX_ENTRIES)
+        _github_release_cache[url] = {"etag": etag, "release": release}
+    return release
+
+
+# In-memory response cache: key -> (expires_at, items)
+_cache: Dict[str, Tuple[float, Any]] = {}
+_CACHE_MAX_ENTRIES = 512
+
+
+def _ttl_cache(seconds: float):
+    """Cache a fetcher's non-empty results for ``seconds`` keyed on its arguments."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> List[ContextItem]:
+            key = repr((func.__name__, args, sorted(kwargs.items())))
+            cached = _cache.get(key)
+            now = time.monotonic()
+            if cached and cached[0] > now:
+                return copy.deepcopy(cached[1])
+
+            items = await func(*args, **kwargs)
+            # Empty lists usually mean the provider failed; retry next time
+            if items:
+                _cache.pop(key, None)
+                _evict_to_capacity(_cache, _CACHE_MAX_ENTRIES, now)
+                _cache[key] = (now + seconds, copy.deepcopy(items))
+            return items
+
+        return wrapper
+
+    return decorator
+
+
+async def fetch_context_items(
+    query: str, limit: int = 8, skip_seen: bool = False
+) -> List[ContextItem]:
     """
     Aggregate context snippets from news, arXiv, GitHub, scholarly APIs, and RSS feeds.
+
+    With ``skip_seen``, items returned by any earlier call are left out.
     """
+    tokens = _query_tokens(query)
+    # Cached results were all returned before, so they never survive skip_seen
+    reused = None if skip_seen else _reuse_cached_context(tokens, limit)
+    if reused is not None:
+        _remember_seen(reused)
+        return reused
+
+    # Providers in priority order; scholarly APIs and proceedings are filler.
+    # Filler results are cached for longer and would otherwise win the race
+    # below, so they only count toward stopping early once every priority
+    # provider has answered.
+    providers = [
+        (True, fetch_news_articles(query, max_results=min(4, limit))),
+        (True, fetch_arxiv_papers(query, max_results=3)),
+        (True, fetch_github_releases(query, max_repos=2)),
+        (True, fetch_rss_articles(query, max_articles=3)),
+        (False, fetch_semantic_scholar_papers(query, max_results=3)),
+        (False, fetch_crossref_works(query, max_results=3)),
+        (False, fetch_conference_proceedings(max_items=3)),
+    ]
     tasks = [
-        fetch_news_articles(query, max_results=min(4, limit)),
-        fetch_arxiv_papers(query, max_results=3),
-        fetch_github_releases(query, max_repos=2),
-        fetch_rss_articles(query, max_articles=3),
-        fetch_semantic_scholar_papers(query, max_results=3),
-        fetch_crossref_works(query, max_results=3),
-        fetch_conference_proceedings(max_items=3),
+        asyncio.create_task(_tag_result(priority, coro)) for priority, coro in providers
     ]
 
-    chunks = await asyncio.gather(*tasks, return_exceptions=True)
-
-    results: List[ContextItem] = []
-    for chunk in chunks:
-        if isinstance(chunk, Exception):
-            print(f"Context fetch error: {chunk}")
-            continue
-        results.extend(chunk)
-
-    # Deduplicate by URL while keeping latest timestamps
-    deduped: Dict[str, ContextItem] = {}
-    for item in results:
-        key = item.get("url") or f"{item.get('title')}::{item.get('source')}"
-        existing = deduped.get(key)
-        if not existing:
-            deduped[key] = item
+    # Each provider's items as (sort_key, dedup_key, item), newest first
+    chunks: List[List[Tuple[str, str, ContextItem]]] = []
+    priority_left = sum(1 for priority, _ in providers if priority)
+    priority_keys = set()
+    all_keys = set()
+    try:
+        for next_chunk in asyncio.as_completed(tasks):
+            is_priority, chunk = await next_chunk
+            keyed = [
+                (_published_sort_key(item), _dedup_key(item), item) for item in chunk
+            ]
+            keyed.sort(key=itemgetter(0), reverse=True)
+            chunks.append(keyed)
+            usable = {
+                key for _, key, _ in keyed if not (skip_seen and key in _SEEN_URLS)
+            }
+            all_keys |= usable
+            if is_priority:
+                priority_left -= 1
+                priority_keys |= usable
+            # Enough unique candidates even after dedup; skip the stragglers
+            if len(priority_keys) >= limit or (
+                not priority_left and len(all_keys) >= limit
+            ):
+                break
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    # Merge the presorted chunks newest first; the first copy of a URL is
+    # therefore its latest version. Keep a few extra items for the query
+    # prefix cache unless skip_seen makes them unusable there.
+    wanted = limit if skip_seen else limit * _CONTEXT_OVERSAMPLE
+    sorted_items: List[ContextItem] = []
+    kept_keys = set()
+    for _, key, item in heapq.merge(*chunks, key=itemgetter(0), reverse=True):
+        if key in kept_keys or (skip_seen and key in _SEEN_URLS):
             continue
-        if _parse_datetime(item.get("published_at")) > _parse_datetime(
-            existing.get("published_at")
-        ):
-            deduped[key] = item
-
-    sorted_items = sorted(
-        deduped.values(),
-        key=lambda x: _parse_datetime(x.get("published_at")),
-        reverse=True,
+        kept_keys.add(key)
+        sorted_items.append(item)
+        if len(sorted_items) >= wanted:
+            break
+
+    if not skip_seen:
+        _remember_context(tokens, sorted_items, limit)
+    selected = sorted_items[:limit]
+    _remember_seen(selected)
+    return selected
+
+
+async def _tag_result(tag: bool, coro: Any) -> Tuple[bool, List[ContextItem]]:
+    try:
+        return tag, await coro
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Context fetch error: %s", exc)
+        return tag, []
+
+
+def _remember_seen(items: List[ContextItem]) -> None:
+    for item in items:
+        _SEEN_URLS.add(_dedup_key(item))
+
+
+def _query_tokens(query: str) -> FrozenSet[str]:
+    """Normalize a query to its lowercase, stopword-free token set."""
+    return frozenset(
+        token for token in _TOKEN_RE.findall(query.lower()) if token not in _STOPWORDS
     )
 
-    return sorted_items[:limit]
+
+def _reuse_cached_context(
+    tokens: FrozenSet[str], limit: int
+) -> Optional[List[ContextItem]]:
+    """
+    Answer a follow-up query from an earlier, broader query's results.
+
+    Picks the most specific cached token set contained in ``tokens`` and keeps
+    only items mentioning every extra token. Returns None (forcing a fresh
+    fetch) unless that leaves at least ``limit`` items.
+    """
+    if not tokens:
+        return None
+    now = time.monotonic()
+    best: Optional[FrozenSet[str]] = None
+    for cached_tokens, (expires_at, _) in _query_prefix_cache.items():
+        if expires_at <= now or not cached_tokens <= tokens:
+            continue
+        if best is None or len(cached_tokens) > len(best):
+            best = cached_tokens
+    if best is None:
+        return None
+
+    items = _query_prefix_cache[best][1]
+    delta = tokens - best
+    if delta:
+        # Whole-token matches only, tokenized like the query itself, so "ai"
+        # does not match "training"
+        items = [
+            item
+            for item in items
+            if delta <= set(_TOKEN_RE.findall(f"{item.title} {item.summary}".lower()))
+        ]
+    if len(items) < limit:
+        return None
+    return copy.deepcopy(items[:limit])
+
+
+def _remember_context(
+    tokens: FrozenSet[str], items: List[ContextItem], limit: int
+) -> None:
+    # A short aggregate usually means providers failed or were cancelled;
+    # fetch again next time rather than replaying it
+    if not tokens or len(items) < limit:
+        return
+    now = time.monotonic()
+    _query_prefix_cache.pop(tokens, None)
+    _evict_to_capacity(_query_prefix_cache, _QUERY_CACHE_MAX_ENTRIES, now)
+    _query_prefix_cache[tokens] = (now + _QUERY_CACHE_TTL, list(items))
 
 
+@_ttl_cache(seconds=300)
 async def fetch_news_articles(
     query: str,
     max_results: int = 3,
@@ -99,16 +560,17 @@ async def fetch_news_articles(
     headers = {"X-Api-Key": NEWSAPI_KEY}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{NEWSAPI_BASE_URL}/everything",
-                params=params,
-                headers=headers,
-            )
-            response.raise_for_status()
-            payload = response.json()
+        client = await _get_client()
+        response = await _get(
+            client,
+            f"{NEWSAPI_BASE_URL}/everything",
+            params=params,
+            headers=headers,
+        )
+        response.raise_for_status()
+        payload = _json_loads(response.content)
     except Exception as exc:  # noqa: BLE001
-        print(f"News retrieval failed: {exc}")
+        logger.warning("News retrieval failed: %s", exc)
         return []
 
     articles = payload.get("articles") or []
@@ -131,6 +593,7 @@ async def fetch_news_articles(
     return results
 
 
+@_ttl_cache(seconds=1800)
 async def fetch_arxiv_papers(
     query: str,
     max_results: int = 3,
@@ -139,28 +602,25 @@ async def fetch_arxiv_papers(
     if not query:
         return []
 
-    params = {
-        "search_query": f"all:{query}",
-        "start": 0,
-        "max_results": max_results,
-        "sortBy": "submittedDate",
-        "sortOrder": "descending",
-    }
-    query_string = "&".join(f"{k}={quote_plus(str(v))}" for k, v in params.items())
-    url = f"{ARXIV_API_URL}?{query_string}"
+    url = (
+        f"{ARXIV_API_URL}?search_query=all%3A{quote_plus(query)}"
+        f"&max_results={max_results}{_ARXIV_STATIC_QS}"
+    )
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            feed_xml = response.text
+        client = await _get_client()
+        response = await _get(client, url)
+        response.raise_for_status()
+        feed_xml = response.content
     except Exception as exc:  # noqa: BLE001
-        print(f"arXiv retrieval failed: {exc}")
+        logger.warning("arXiv retrieval failed: %s", exc)
         return []
 
-    return _parse_arxiv_feed(feed_xml)
+    # Keep XML parsing off the event loop, as _fetch_feed does for RSS
+    return await asyncio.to_thread(_parse_arxiv_feed, feed_xml, max_results)
 
 
+@_ttl_cache(seconds=1800)
 async def fetch_semantic_scholar_papers(
     query: str,
     max_results: int = 3,
@@ -180,20 +640,22 @@ async def fetch_semantic_scholar_papers(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                "https://api.semanticscholar.org/graph/v1/paper/search",
-                params=params,
-            )
-            response.raise_for_status()
-            payload = response.json()
+        client = await _get_client()
+        response = await _get(
+            client,
+            "https://api.semanticscholar.org/graph/v1/paper/search",
+            params=params,
+        )
+        response.raise_for_status()
+        payload = _json_loads(response.content)
     except Exception as exc:  # noqa: BLE001
-        print(f"Semantic Scholar retrieval failed: {exc}")
+        logger.warning("Semantic Scholar retrieval failed: %s", exc)
         return []
 
     return _parse_semantic_scholar_payload(payload, max_results, max_age_days)
 
 
+@_ttl_cache(seconds=1800)
 async def fetch_crossref_works(
     query: str,
     max_results: int = 3,
@@ -213,17 +675,18 @@ async def fetch_crossref_works(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get("https://api.crossref.org/works", params=params)
-            response.raise_for_status()
-            payload = response.json()
+        client = await _get_client()
+        response = await _get(client, "https://api.crossref.org/works", params=params)
+        response.raise_for_status()
+        payload = _json_loads(response.content)
     except Exception as exc:  # noqa: BLE001
-        print(f"Crossref retrieval failed: {exc}")
+        logger.warning("Crossref retrieval failed: %s", exc)
         return []
 
     return _parse_crossref_payload(payload, max_results, max_age_days)
 
 
+@_ttl_cache(seconds=3600)
 async def fetch_conference_proceedings(
     max_items: int = 3,
     max_age_days: int = 365,
@@ -232,39 +695,28 @@ async def fetch_conference_proceedings(
     if not PROCEEDINGS_FEEDS:
         return []
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        fetch_tasks = [
-            client.get(feed["url"], headers=RSS_REQUEST_HEADERS)
+    client = await _get_client()
+    feeds = await asyncio.gather(
+        *[
+            _fetch_feed(client, feed["url"], "Proceedings feed")
             for feed in PROCEEDINGS_FEEDS
-        ]
-        responses = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+        ],
+        return_exceptions=True,
+    )
 
     items: List[ContextItem] = []
-    for feed_meta, resp in zip(PROCEEDINGS_FEEDS, responses):
-        if isinstance(resp, Exception):
-            print(f"Proceedings fetch failed for {feed_meta['provider']}: {resp}")
-            continue
-
-        try:
-            parsed_items = _parse_proceedings_feed(
-                resp.content,
-                feed_meta["url"],
-                feed_meta["provider"],
-                max_age_days,
+    for feed_meta, feed in zip(PROCEEDINGS_FEEDS, feeds):
+        if isinstance(feed, Exception):
+            logger.warning(
+                "Proceedings fetch failed for %s: %s", feed_meta["provider"], feed
             )
-            items.extend(parsed_items)
-        except Exception as exc:  # noqa: BLE001
-            print(f"Proceedings parse failed for {feed_meta['provider']}: {exc}")
             continue
+        items.extend(_proceedings_items(feed, feed_meta["provider"], max_age_days))
 
-    sorted_items = sorted(
-        items,
-        key=lambda x: _parse_datetime(x.get("published_at")),
-        reverse=True,
-    )
-    return sorted_items[:max_items]
+    return heapq.nlargest(max_items, items, key=_published_sort_key)
 
 
+@_ttl_cache(seconds=300)
 async def fetch_github_releases(
     query: str,
     max_repos: int = 2,
@@ -280,61 +732,56 @@ async def fetch_github_releases(
     if GITHUB_TOKEN:
         headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
 
-    params = {
-        "q": query,
-        "sort": "updated",
-        "order": "desc",
-        "per_page": max_repos,
-    }
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            search_resp = await client.get(
-                f"{GITHUB_API_URL}/search/repositories",
-                params=params,
-                headers=headers,
-            )
-            search_resp.raise_for_status()
-            repos = (search_resp.json().get("items") or [])[:max_repos]
-
-            releases: List[ContextItem] = []
-            for repo in repos:
-                owner = repo["owner"]["login"]
-                name = repo["name"]
-                release_url = f"{GITHUB_API_URL}/repos/{owner}/{name}/releases/latest"
-                try:
-                    release_resp = await client.get(release_url, headers=headers)
-                    if release_resp.status_code == 404:
-                        continue
-                    release_resp.raise_for_status()
-                except Exception as release_exc:  # noqa: BLE001
-                    print(f"Release fetch failed for {owner}/{name}: {release_exc}")
-                    continue
+        client = await _get_client()
+        repos = await _search_github_repos(client, query, max_repos, headers)
+
+        release_urls = [
+            f"{GITHUB_API_URL}/repos/{repo['owner']['login']}/{repo['name']}"
+            "/releases/latest"
+            for repo in repos
+        ]
+        release_payloads = await asyncio.gather(
+            *[_fetch_github_release(client, url, headers) for url in release_urls],
+            return_exceptions=True,
+        )
 
-                release = release_resp.json()
-                published_at = _format_timestamp(
-                    release.get("published_at") or release.get("created_at")
+        releases: List[ContextItem] = []
+        for repo, release in zip(repos, release_payloads):
+            owner = repo["owner"]["login"]
+            name = repo["name"]
+            if isinstance(release, Exception):
+                logger.warning(
+                    "Release fetch failed for %s/%s: %s", owner, name, release
                 )
-                releases.append(
-                    _build_context_item(
-                        provider="github",
-                        source=f"{owner}/{name}",
-                        title=release.get("name") or repo.get("full_name"),
-                        summary=release.get("body") or repo.get("description"),
-                        url=release.get("html_url") or repo.get("html_url"),
-                        published_at=published_at,
-                        content=release.get("body"),
-                        extra={"tag_name": release.get("tag_name")},
-                    )
+                continue
+            if release is None:
+                continue  # repository has no published releases
+
+            published_at = _format_timestamp(
+                release.get("published_at") or release.get("created_at")
+            )
+            releases.append(
+                _build_context_item(
+                    provider="github",
+                    source=f"{owner}/{name}",
+                    title=release.get("name") or repo.get("full_name"),
+                    summary=release.get("body") or repo.get("description"),
+                    url=release.get("html_url") or repo.get("html_url"),
+                    published_at=published_at,
+                    content=release.get("body"),
+                    extra={"tag_name": release.get("tag_name")},
                 )
+            )
 
     except Exception as exc:  # noqa: BLE001
-        print(f"GitHub retrieval failed: {exc}")
+        logger.warning("GitHub retrieval failed: %s", exc)
         return []
 
     return releases
 
 
+@_ttl_cache(seconds=600)
 async def fetch_rss_articles(
     query: str,
     max_articles: int = 3,
@@ -343,47 +790,60 @@ async def fetch_rss_articles(
     if not TECH_RSS_FEEDS or not query:
         return []
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        fetch_tasks = [
-            client.get(url, headers=RSS_REQUEST_HEADERS) for url in TECH_RSS_FEEDS
-        ]
-        responses = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+    client = await _get_client()
+    feed_urls = {
+        asyncio.create_task(_fetch_feed(client, url, "RSS feed")): url
+        for url in TECH_RSS_FEEDS
+    }
 
     matched_items: List[ContextItem] = []
-    query_lower = query.lower()
-
-    for feed_url, resp in zip(TECH_RSS_FEEDS, responses):
-        if isinstance(resp, Exception):
-            print(f"RSS fetch failed for {feed_url}: {resp}")
-            continue
-
-        try:
-            items = _parse_rss_feed(resp.content, feed_url)
-        except Exception as exc:  # noqa: BLE001
-            print(f"RSS parse failed for {feed_url}: {exc}")
-            continue
+    query_lc = query.lower().encode("utf-8")
 
-        for item in items:
-            haystack = f"{item.get('title', '')} {item.get('summary', '')}".lower()
-            if query_lower not in haystack:
-                continue
-            matched_items.append(item)
-            if len(matched_items) >= max_articles:
-                break
+    # Scan feeds as they arrive and drop the remaining downloads once enough
+    # posts have matched
+    pending = set(feed_urls)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    feed_title, entries = task.result()
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("RSS fetch failed for %s: %s", feed_urls[task], exc)
+                    continue
 
-        if len(matched_items) >= max_articles:
-            break
+                source = feed_title or "RSS Feed"
+                # Match on the precomputed lowercase bytes first so non-matching
+                # entries skip HTML stripping and item construction entirely.
+                for title, summary, link, published, title_lc, summary_lc in entries:
+                    if query_lc not in title_lc and query_lc not in summary_lc:
+                        continue
+                    matched_items.append(
+                        _build_rss_item(source, title, summary, link, published)
+                    )
+                    if len(matched_items) >= max_articles:
+                        return matched_items
+    finally:
+        unfinished = [task for task in feed_urls if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
 
     return matched_items
 
 
-def _parse_arxiv_feed(feed_xml: str) -> List[ContextItem]:
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-    root = ET.fromstring(feed_xml)
-    entries = root.findall("atom:entry", ns)
+def _parse_arxiv_feed(feed_xml: bytes, max_results: int) -> List[ContextItem]:
+    ns = {"atom": _ATOM_NS}
     results: List[ContextItem] = []
+    if max_results <= 0:
+        return results
 
-    for entry in entries:
+    # Stream entries and stop once enough are read instead of building the DOM
+    for _, entry in ET.iterparse(io.BytesIO(feed_xml), events=("end",)):
+        if entry.tag != _ATOM_ENTRY_TAG:
+            continue
         title = (entry.findtext("atom:title", default="", namespaces=ns) or "").strip()
         summary = (
             entry.findtext("atom:summary", default="", namespaces=ns) or ""
@@ -413,6 +873,9 @@ def _parse_arxiv_feed(feed_xml: str) -> List[ContextItem]:
                 extra={"authors": authors},
             )
         )
+        entry.clear()
+        if len(results) >= max_results:
+            break
 
     return results
 
@@ -471,7 +934,7 @@ def _parse_crossref_payload(
         )
         title = item.get("title", [])
         title_text = title[0] if title else None
-        summary = _strip_html(item.get("abstract")) if item.get("abstract") else ""
+        summary = _strip_html(item.get("abstract"))
         container_titles = item.get("container-title") or []
 
         results.append(
@@ -492,95 +955,187 @@ def _parse_crossref_payload(
     return results
 
 
-def _parse_proceedings_feed(
-    feed_bytes: bytes, feed_url: str, provider: str, max_age_days: int
+def _proceedings_items(
+    feed: ParsedFeed, provider: str, max_age_days: int
 ) -> List[ContextItem]:
-    parsed = feedparser.parse(feed_bytes)
-    if getattr(parsed, "bozo", False):
-        exc = getattr(parsed, "bozo_exception", None)
-        if exc and not getattr(parsed, "entries", None):
-            raise ValueError(f"{exc}")
-        if exc:
-            print(
-                f"Proceedings feed had parsing issues but will proceed for {feed_url}: {exc}"
-            )
-
-    feed_title = (parsed.feed.get("title") if parsed.feed else None) or provider.upper()
+    parsed_title, entries = feed
+    feed_title = parsed_title or provider.upper()
     results: List[ContextItem] = []
     cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
 
-    for entry in parsed.entries or []:
-        title = entry.get("title") or "Untitled"
-        summary = entry.get("summary") or ""
-        link = entry.get("link")
-        published = (
-            entry.get("published")
-            or entry.get("updated")
-            or _struct_time_to_iso(entry.get("published_parsed"))
-            or _struct_time_to_iso(entry.get("updated_parsed"))
-        )
+    for title, summary, link, published, _, _ in entries:
         published_dt = _coerce_datetime(published)
         if published_dt and published_dt < cutoff:
             continue
 
+        clean = _strip_html(summary)
         results.append(
             _build_context_item(
                 provider=provider,
                 source=feed_title,
                 title=title,
-                summary=_strip_html(summary),
+                summary=clean,
                 url=link,
                 published_at=_format_timestamp(published),
-                content=_strip_html(summary),
+                content=clean,
             )
         )
 
     return results
 
 
-def _parse_rss_feed(feed_bytes: bytes, feed_url: str) -> List[ContextItem]:
+def _parse_feed(feed_bytes: bytes, feed_url: str, label: str) -> ParsedFeed:
+    """Return (feed_title, normalized entries), preferring the direct XML walker."""
+    try:
+        feed_title, entries = _fast_rss_parse(feed_bytes)
+        return feed_title, [_feed_entry(entry) for entry in entries]
+    except Exception:  # noqa: BLE001
+        pass  # fall back to feedparser's tolerant parser for malformed feeds
+
     parsed = feedparser.parse(feed_bytes)
     if getattr(parsed, "bozo", False):
         exc = getattr(parsed, "bozo_exception", None)
         if exc and not getattr(parsed, "entries", None):
             raise ValueError(f"{exc}")  # propagate so caller logs failure
         if exc:
-            print(f"RSS feed had parsing issues but will proceed for {feed_url}: {exc}")
+            logger.warning(
+                "%s had parsing issues but will proceed for %s: %s",
+                label,
+                feed_url,
+                exc,
+            )
 
-    feed_title = (parsed.feed.get("title") if parsed.feed else None) or "RSS Feed"
-    results: List[ContextItem] = []
+    feed_title = parsed.feed.get("title") if parsed.feed else None
+    return feed_title, [_feed_entry(entry) for entry in parsed.entries or []]
 
-    for entry in parsed.entries or []:
-        title = entry.get("title") or "Untitled"
-        summary = entry.get("summary")
-        if not summary:
-            contents = entry.get("content") or []
-            if contents and isinstance(contents, list):
-                summary = contents[0].get("value")
-        summary = summary or ""
-
-        link = entry.get("link")
-
-        published = (
-            entry.get("published")
-            or entry.get("updated")
-            or _struct_time_to_iso(entry.get("published_parsed"))
-            or _struct_time_to_iso(entry.get("updated_parsed"))
-        )
 
-        results.append(
-            _build_context_item(
-                provider="rss",
-                source=feed_title,
-                title=title,
-                summary=_strip_html(summary),
-                url=link,
-                published_at=_format_timestamp(published),
-                content=_strip_html(summary),
-            )
-        )
+def _fast_rss_parse(feed_bytes: bytes) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    Stream RSS 2.0 / Atom entries straight out of the XML.
 
-    return results
+    Entries use the same keys as feedparser ("title", "summary", "content",
+    "link", "published", "updated") so downstream field handling is shared.
+    Each entry is detached from the tree once read, keeping memory flat on
+    large feeds. Raises ValueError for any other feed flavour.
+    """
+    feed_title: Optional[str] = None
+    entries: List[Dict[str, Any]] = []
+    is_atom: Optional[bool] = None
+    stack: List[Any] = []
+
+    for event, elem in ET.iterparse(io.BytesIO(feed_bytes), events=("start", "end")):
+        if event == "start":
+            if is_atom is None:
+                if elem.tag not in ("rss", _ATOM_FEED_TAG):
+                    raise ValueError(f"Unsupported feed root element: {elem.tag}")
+                is_atom = elem.tag == _ATOM_FEED_TAG
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        parent = stack[-1] if stack else None
+        if is_atom:
+            if elem.tag == _ATOM_TITLE_TAG and len(stack) == 1:
+                feed_title = _xml_text(elem)
+                continue
+            if elem.tag != _ATOM_ENTRY_TAG:
+                continue
+            entries.append(_atom_entry_fields(elem))
+        else:
+            if elem.tag == "title" and parent is not None and parent.tag == "channel":
+                feed_title = _xml_text(elem)
+                continue
+            if elem.tag != "item":
+                continue
+            entries.append(_rss_item_fields(elem))
+
+        elem.clear()
+        if parent is not None:
+            parent.remove(elem)
+
+    return feed_title, entries
+
+
+def _rss_item_fields(item: Any) -> Dict[str, Any]:
+    content = _xml_text(item.find(_RSS_CONTENT_TAG))
+    return {
+        "title": _xml_text(item.find("title")),
+        "summary": _xml_text(item.find("description")),
+        "content": [{"value": content}] if content else [],
+        "link": _xml_text(item.find("link")),
+        "published": (
+            _xml_text(item.find("pubDate")) or _xml_text(item.find(_DC_DATE_TAG))
+        ),
+    }
+
+
+def _atom_entry_fields(entry: Any) -> Dict[str, Any]:
+    link = None
+    for link_el in entry.findall(f"{{{_ATOM_NS}}}link"):
+        if link_el.get("rel", "alternate") == "alternate":
+            link = link_el.get("href")
+            break
+    content = _xml_text(entry.find(f"{{{_ATOM_NS}}}content"))
+    return {
+        "title": _xml_text(entry.find(_ATOM_TITLE_TAG)),
+        "summary": _xml_text(entry.find(f"{{{_ATOM_NS}}}summary")),
+        "content": [{"value": content}] if content else [],
+        "link": link,
+        "published": _xml_text(entry.find(f"{{{_ATOM_NS}}}published")),
+        "updated": _xml_text(entry.find(f"{{{_ATOM_NS}}}updated")),
+    }
+
+
+def _xml_text(element: Any) -> Optional[str]:
+    if element is None:
+        return None
+    text = "".join(element.itertext()).strip()
+    return text or None
+
+
+def _feed_entry(entry: Any) -> FeedEntry:
+    """Normalize a feedparser-style entry dict into a FeedEntry tuple."""
+    title = entry.get("title") or "Untitled"
+    summary = entry.get("summary")
+    if not summary:
+        contents = entry.get("content") or []
+        if contents and isinstance(contents, list):
+            summary = contents[0].get("value")
+    summary = summary or ""
+
+    published = (
+        entry.get("published")
+        or entry.get("updated")
+        or _struct_time_to_iso(entry.get("published_parsed"))
+        or _struct_time_to_iso(entry.get("updated_parsed"))
+    )
+    return (
+        title,
+        summary,
+        entry.get("link"),
+        published,
+        title.lower().encode("utf-8"),
+        summary.lower().encode("utf-8"),
+    )
+
+
+def _build_rss_item(
+    source: str,
+    title: str,
+    summary: str,
+    link: Optional[str],
+    published: Optional[str],
+) -> ContextItem:
+    clean = _strip_html(summary)
+    return _build_context_item(
+        provider="rss",
+        source=source,
+        title=title,
+        summary=clean,
+        url=link,
+        published_at=_format_timestamp(published),
+        content=clean,
+    )
 
 
 def _build_context_item(
@@ -593,60 +1148,88 @@ def _build_context_item(
     content: Optional[str],
     extra: Optional[Dict[str, Any]] = None,
 ) -> ContextItem:
-    item: ContextItem = {
-        "provider": provider,
-        "source": source or provider,
-        "title": title or "Untitled",
-        "summary": summary or "",
-        "url": url,
-        "published_at": published_at or "Unknown date",
-        "content": content or summary or "",
-    }
-    if extra:
-        item["metadata"] = extra
-    return item
+    summary = summary or ""
+    return ContextItem(
+        provider=provider,
+        source=source or provider,
+        title=title or "Untitled",
+        summary=summary,
+        url=url,
+        published_at=published_at or "Unknown date",
+        content=content or summary,
+        metadata=extra or None,
+    )
+
+
+def _dedup_key(item: ContextItem) -> str:
+    if item.url:
+        return _normalize_url(item.url)
+    return f"{item.title}::{item.source}"
+
+
+def _normalize_url(url: str) -> str:
+    """Canonicalize a URL so tracking-parameter variants dedupe together."""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    query = urlencode(
+        [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking_param(key)
+        ]
+    )
+    path = parts.path.rstrip("/") if parts.path != "/" else ""
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key in _TRACKING_PARAMS or key.startswith("utm_")
 
 
 def _strip_html(text: Optional[str]) -> str:
     if not text:
         return ""
-    # Very light HTML removal
-    return (
-        text.replace("<p>", " ")
-        .replace("</p>", " ")
-        .replace("<br>", " ")
-        .replace("<br/>", " ")
-        .replace("<br />", " ")
-        .strip()
-    )
+    # Light HTML removal: drop every tag, decode entities, collapse whitespace
+    text = _HTML_TAG_RE.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return _WS_RE.sub(" ", text).strip()
 
 
 def _format_timestamp(timestamp: Optional[str]) -> str:
+    """Render any provider timestamp in the canonical "%Y-%m-%d %H:%M UTC" form."""
     if not timestamp:
         return "Unknown date"
-    try:
-        ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return ts.strftime("%Y-%m-%d %H:%M UTC")
-    except Exception:
-        try:
-            ts = datetime.strptime(timestamp, "%a, %d %b %Y %H:%M:%S %Z")
-            return ts.strftime("%Y-%m-%d %H:%M UTC")
-        except Exception:
-            return timestamp
+    return _format_timestamp_str(timestamp)
 
 
-def _parse_datetime(timestamp: Optional[str]) -> datetime:
-    if not timestamp or timestamp == "Unknown date":
-        return datetime.min
-    for fmt in ("%Y-%m-%d %H:%M UTC", "%Y-%m-%dT%H:%M:%SZ"):
-        try:
-            return datetime.strptime(timestamp, fmt)
-        except ValueError:
-            continue
+# Release dates, update times and pubDates repeat across providers and queries
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp_str(timestamp: str) -> str:
     try:
-        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    except Exception:
-        return datetime.min
+        ts = datetime.fromisoformat(
+            timestamp.replace(" UTC", "+00:00").replace("Z", "+00:00")
+        )
+    except ValueError:
+        try:
+            ts = parsedate_to_datetime(timestamp)  # RFC 822 dates used by RSS
+        except (TypeError, ValueError):
+            return "Unknown date"
+    if ts.tzinfo:
+        ts = ts.astimezone(timezone.utc)
+    return ts.strftime("%Y-%m-%d %H:%M UTC")
+
+
+def _published_sort_key(item: ContextItem) -> str:
+    # Canonical "%Y-%m-%d %H:%M UTC" strings order lexicographically exactly
+    # like the datetimes they encode, so no parsing is needed to sort.
+    published_at = item.published_at
+    if not published_at or published_at == "Unknown date":
+        return ""
+    return published_at
 
 
 def _coerce_datetime(raw: Optional[Any]) -> Optional[datetime]:
@@ -706,10 +1289,11 @@ def _safe_get(data: Dict[str, Any], *keys: str) -> Any:
 def _struct_time_to_iso(struct: Optional[time.struct_time]) -> Optional[str]:
     if not struct:
         return None
+    # feedparser already normalizes *_parsed fields to UTC
     try:
         return (
-            datetime.fromtimestamp(calendar.timegm(struct), tz=timezone.utc)
-            .strftime("%Y-%m-%dT%H:%M:%SZ")
+            f"{struct.tm_year:04d}-{struct.tm_mon:02d}-{struct.tm_mday:02d}"
+            f"T{struct.tm_hour:02d}:{struct.tm_min:02d}:{struct.tm_sec:02d}Z"
         )
     except Exception:
         return None
@@ -12,6 +12,7 @@ if "dotenv" not in sys.modules:
     sys.modules["dotenv"] = SimpleNamespace(load_dotenv=_DotenvStub.load_dotenv)
 
 from backend import council
+from backend.retrieval import ContextItem
 
 
 def test_stage1_system_prompt_discourages_cutoff_disclaimers() -> None:
@@ -26,14 +27,15 @@ def test_stage1_system_prompt_discourages_cutoff_disclaimers() -> None:
 
 def test_stage1_prompt_includes_context_block_when_available() -> None:
     context_items = [
-        {
-            "title": "Fresh News",
-            "source": "NewsAPI",
-            "summary": "Summary text",
-            "content": "Full text",
-            "published_at": "2024-12-01 00:00 UTC",
-            "url": "https://example.com/fresh",
-        }
+        ContextItem(
+            provider="newsapi",
+            title="Fresh News",
+            source="NewsAPI",
+            summary="Summary text",
+            content="Full text",
+            published_at="2024-12-01 00:00 UTC",
+            url="https://example.com/fresh",
+        )
     ]
 
     messages = council._build_stage1_messages("Tell me", context_items=context_items)
@@ -1,6 +1,7 @@
 """Unit tests for retrieval helpers and aggregation."""
 
 import asyncio
+import json
 import sys
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
@@ -91,10 +92,10 @@ class SemanticScholarParsingTests(TestCase):
         results = retrieval._parse_semantic_scholar_payload(payload, 5, 365)
 
         self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]["provider"], "semantic_scholar")
-        self.assertEqual(results[0]["source"], "ICLR")
-        self.assertEqual(results[0]["metadata"]["authors"], ["Alice"])
-        self.assertIn("UTC", results[0]["published_at"])
+        self.assertEqual(results[0].provider, "semantic_scholar")
+        self.assertEqual(results[0].source, "ICLR")
+        self.assertEqual(results[0].metadata["authors"], ["Alice"])
+        self.assertIn("UTC", results[0].published_at)
 
 
 class CrossrefParsingTests(TestCase):
@@ -126,10 +127,10 @@ class CrossrefParsingTests(TestCase):
         results = retrieval._parse_crossref_payload(payload, 5, 365)
 
         self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]["provider"], "crossref")
-        self.assertEqual(results[0]["source"], "JMLR")
-        self.assertEqual(results[0]["metadata"]["doi"], "10.1000/xyz")
-        self.assertEqual(results[0]["content"], "Concise summary")
+        self.assertEqual(results[0].provider, "crossref")
+        self.assertEqual(results[0].source, "JMLR")
+        self.assertEqual(results[0].metadata["doi"], "10.1000/xyz")
+        self.assertEqual(results[0].content, "Concise summary")
 
 
 class ProceedingsParsingTests(TestCase):
@@ -157,17 +158,22 @@ class ProceedingsParsingTests(TestCase):
             </rss>
         """.encode()
 
-        results = retrieval._parse_proceedings_feed(
-            feed, "https://neurips.cc/rss", "neurips", 400
+        results = retrieval._proceedings_items(
+            retrieval._parse_feed(feed, "https://neurips.cc/rss", "Proceedings feed"),
+            "neurips",
+            400,
         )
 
         self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]["provider"], "neurips")
-        self.assertEqual(results[0]["source"], "NeurIPS")
-        self.assertEqual(results[0]["title"], "Fresh Paper")
+        self.assertEqual(results[0].provider, "neurips")
+        self.assertEqual(results[0].source, "NeurIPS")
+        self.assertEqual(results[0].title, "Fresh Paper")
 
 
 class AggregationTests(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        retrieval._query_prefix_cache.clear()
+
     async def test_fetch_context_items_aggregates_new_sources(self) -> None:
         base_item = retrieval._build_context_item(
             provider="rss",
@@ -226,5 +232,635 @@ class AggregationTests(IsolatedAsyncioTestCase):
                                     results = await retrieval.fetch_context_items("test", limit=5)
 
         self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]["provider"], "semantic_scholar")
-        self.assertEqual(results[0]["url"], "https://example.org/dup")
+        self.assertEqual(results[0].provider, "semantic_scholar")
+        self.assertEqual(results[0].url, "https://example.org/dup")
+
+    async def test_fetch_context_items_cancels_slow_providers_once_saturated(self) -> None:
+        fast_items = [
+            retrieval._build_context_item(
+                provider="newsapi",
+                source="Wire",
+                title=f"Story {idx}",
+                summary="",
+                url=f"https://example.org/{idx}",
+                published_at=f"2024-01-0{idx} 00:00 UTC",
+                content="",
+            )
+            for idx in range(1, 5)
+        ]
+        cancelled = asyncio.Event()
+
+        async def never_finishes(*_, **__):
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with mock.patch.multiple(
+            retrieval,
+            fetch_news_articles=mock.AsyncMock(return_value=fast_items),
+            fetch_arxiv_papers=never_finishes,
+            fetch_github_releases=never_finishes,
+            fetch_rss_articles=never_finishes,
+            fetch_semantic_scholar_papers=never_finishes,
+            fetch_crossref_works=never_finishes,
+            fetch_conference_proceedings=never_finishes,
+        ):
+            results = await asyncio.wait_for(
+                retrieval.fetch_context_items("test", limit=2), timeout=1
+            )
+
+        self.assertTrue(cancelled.is_set())
+        self.assertEqual([item.title for item in results], ["Story 4", "Story 3"])
+
+    async def test_fetch_context_items_filler_cannot_cut_off_priority_sources(
+        self,
+    ) -> None:
+        def item(provider: str, idx: int, year: int = 2023) -> retrieval.ContextItem:
+            return retrieval._build_context_item(
+                provider=provider,
+                source=provider,
+                title=f"{provider} {idx}",
+                summary="",
+                url=f"https://{provider}.org/{idx}",
+                published_at=f"{year}-01-0{idx + 1} 00:00 UTC",
+                content="",
+            )
+
+        async def slow_github(*_, **__):
+            await asyncio.sleep(0.01)
+            return [item("github", 0, year=2024)]
+
+        empty = mock.AsyncMock(return_value=[])
+        with mock.patch.multiple(
+            retrieval,
+            fetch_news_articles=empty,
+            fetch_arxiv_papers=empty,
+            fetch_github_releases=slow_github,
+            fetch_rss_articles=empty,
+            fetch_semantic_scholar_papers=empty,
+            fetch_crossref_works=empty,
+            fetch_conference_proceedings=mock.AsyncMock(
+                return_value=[item("proceedings", idx) for idx in range(6)]
+            ),
+        ):
+            results = await retrieval.fetch_context_items("test", limit=2)
+
+        self.assertIn("github", [result.provider for result in results])
+
+    async def test_fetch_context_items_skips_filler_when_priority_fills_default_limit(
+        self,
+    ) -> None:
+        def batch(provider: str, count: int) -> list:
+            return [
+                retrieval._build_context_item(
+                    provider=provider,
+                    source=provider,
+                    title=f"{provider} {idx}",
+                    summary="",
+                    url=f"https://{provider}.org/{idx}",
+                    published_at=f"2024-01-0{idx + 1} 00:00 UTC",
+                    content="",
+                )
+                for idx in range(count)
+            ]
+
+        cancelled = []
+
+        async def never_finishes(*_, **__):
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with mock.patch.multiple(
+            retrieval,
+            fetch_news_articles=mock.AsyncMock(return_value=batch("news", 4)),
+            fetch_arxiv_papers=mock.AsyncMock(return_value=batch("arxiv", 3)),
+            fetch_github_releases=mock.AsyncMock(return_value=batch("github", 2)),
+            fetch_rss_articles=mock.AsyncMock(return_value=batch("rss", 3)),
+            fetch_semantic_scholar_papers=never_finishes,
+            fetch_crossref_works=never_finishes,
+            fetch_conference_proceedings=never_finishes,
+        ):
+            results = await asyncio.wait_for(
+                retrieval.fetch_context_items("test"), timeout=1
+            )
+
+        self.assertEqual(len(cancelled), 3)
+        self.assertEqual(len(results), 8)
+
+    async def test_fetch_context_items_skip_seen_drops_returned_urls(self) -> None:
+        def story(idx: int) -> retrieval.ContextItem:
+            return retrieval._build_context_item(
+                provider="newsapi",
+                source="Wire",
+                title=f"Story {idx}",
+                summary="",
+                url=f"https://example.org/{idx}?utm_source=feed",
+                published_at=f"2024-01-0{idx} 00:00 UTC",
+                content="",
+            )
+
+        empty = mock.AsyncMock(return_value=[])
+        with mock.patch.object(
+            retrieval, "_SEEN_URLS", retrieval._BloomFilter(1000, 1e-4)
+        ), mock.patch.multiple(
+            retrieval,
+            fetch_news_articles=mock.AsyncMock(return_value=[story(1), story(2)]),
+            fetch_arxiv_papers=empty,
+            fetch_github_releases=empty,
+            fetch_rss_articles=empty,
+            fetch_semantic_scholar_papers=empty,
+            fetch_crossref_works=empty,
+            fetch_conference_proceedings=empty,
+        ):
+            first = await retrieval.fetch_context_items("test", limit=1)
+            second = await retrieval.fetch_context_items(
+                "test", limit=1, skip_seen=True
+            )
+
+        self.assertEqual([item.title for item in first], ["Story 2"])
+        self.assertEqual([item.title for item in second], ["Story 1"])
+
+
+class DatetimeParsingTests(TestCase):
+    def test_format_timestamp_emits_sortable_utc_strings(self) -> None:
+        formatted = [
+            retrieval._format_timestamp("2024-01-01T05:06:07+02:00"),
+            retrieval._format_timestamp("Tue, 02 Jan 2024 10:00:00 +0530"),
+            retrieval._format_timestamp("garbled"),
+        ]
+
+        self.assertEqual(
+            formatted,
+            ["2024-01-01 03:06 UTC", "2024-01-02 04:30 UTC", "Unknown date"],
+        )
+        self.assertLess(formatted[0], formatted[1])
+
+    def test_struct_time_to_iso_formats_utc_fields(self) -> None:
+        struct = datetime(2024, 3, 4, 5, 6, 7).timetuple()
+
+        self.assertEqual(retrieval._struct_time_to_iso(struct), "2024-03-04T05:06:07Z")
+        self.assertIsNone(retrieval._struct_time_to_iso(None))
+
+
+class StripHtmlTests(TestCase):
+    def test_strip_html_removes_all_tags_and_collapses_whitespace(self) -> None:
+        text = '<p>Intro <a href="https://x.org">link</a></p>\n<br/><em>more</em>'
+
+        self.assertEqual(retrieval._strip_html(text), "Intro link more")
+        self.assertEqual(
+            retrieval._strip_html("<p>R&amp;D&nbsp;update &lt;beta&gt;</p>"),
+            "R&D update <beta>",
+        )
+        self.assertEqual(retrieval._strip_html(None), "")
+
+
+class TtlCacheTests(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        retrieval._cache.clear()
+
+    async def test_ttl_cache_reuses_non_empty_results_only(self) -> None:
+        calls = []
+
+        @retrieval._ttl_cache(seconds=60)
+        async def fetch(query: str, max_results: int = 3):
+            calls.append(query)
+            return [{"title": query}] if query != "empty" else []
+
+        first = await fetch("llm", max_results=2)
+        first[0]["title"] = "mutated"
+        second = await fetch("llm", max_results=2)
+        await fetch("empty")
+        await fetch("empty")
+
+        self.assertEqual(second, [{"title": "llm"}])
+        self.assertEqual(calls, ["llm", "empty", "empty"])
+
+
+class CacheEvictionTests(TestCase):
+    def test_evict_to_capacity_drops_expired_then_oldest_entries(self) -> None:
+        cache = {"old": (5.0, 1), "stale": (1.0, 2), "new": (9.0, 3)}
+
+        retrieval._evict_to_capacity(cache, 3, now=2.0)
+        self.assertEqual(list(cache), ["old", "new"])
+
+        retrieval._evict_to_capacity(cache, 2, now=2.0)
+        self.assertEqual(list(cache), ["new"])
+
+        plain = {"a": {}, "b": {}}
+        retrieval._evict_to_capacity(plain, 2)
+        self.assertEqual(list(plain), ["b"])
+
+
+class RssFilteringTests(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        retrieval._cache.clear()
+        retrieval._feed_cache.clear()
+
+    async def test_fetch_rss_articles_matches_case_insensitively(self) -> None:
+        feed = b"""
+            <rss version="2.0">
+              <channel>
+                <title>Lab Blog</title>
+                <item>
+                  <title>Scaling Transformers</title>
+                  <link>https://lab.org/scaling</link>
+                  <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
+                  <description>&lt;p&gt;Notes on &lt;em&gt;scale&lt;/em&gt;&lt;/p&gt;</description>
+                </item>
+                <item>
+                  <title>Unrelated</title>
+                  <link>https://lab.org/other</link>
+                  <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
+                  <description>Nothing to see</description>
+                </item>
+              </channel>
+            </rss>
+        """
+        response = SimpleNamespace(status_code=200, content=feed, headers={})
+
+        with mock.patch.object(retrieval, "TECH_RSS_FEEDS", ["https://lab.org/rss"]):
+            with mock.patch.object(retrieval, "_get_client", new_callable=mock.AsyncMock):
+                with mock.patch.object(
+                    retrieval, "_get", new_callable=mock.AsyncMock, return_value=response
+                ):
+                    results = await retrieval.fetch_rss_articles("transformers")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].source, "Lab Blog")
+        self.assertEqual(results[0].url, "https://lab.org/scaling")
+        self.assertEqual(results[0].summary, "Notes on scale")
+
+    async def test_fetch_rss_articles_logs_the_failing_feed_url(self) -> None:
+        failing = mock.AsyncMock(side_effect=RuntimeError("connection reset"))
+
+        with mock.patch.object(retrieval, "TECH_RSS_FEEDS", ["https://down.org/rss"]):
+            with mock.patch.object(retrieval, "_get_client", new_callable=mock.AsyncMock):
+                with mock.patch.object(retrieval, "_fetch_feed", failing):
+                    with self.assertLogs(retrieval.logger, "WARNING") as logs:
+                        results = await retrieval.fetch_rss_articles("scaling")
+
+        self.assertEqual(results, [])
+        self.assertIn("https://down.org/rss", logs.output[0])
+
+    async def test_fetch_rss_articles_cancels_remaining_feeds_once_full(self) -> None:
+        fast_feed = (
+            "Lab Blog",
+            [
+                ("Scaling laws", "", "https://lab.org/a", None, b"scaling laws", b""),
+                ("More scaling", "", "https://lab.org/b", None, b"more scaling", b""),
+            ],
+        )
+        cancelled = asyncio.Event()
+
+        async def fake_fetch_feed(client, url, label):
+            if url == "https://lab.org/rss":
+                return fast_feed
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        feeds = ["https://lab.org/rss", "https://slow.org/rss"]
+        with mock.patch.object(retrieval, "TECH_RSS_FEEDS", feeds):
+            with mock.patch.object(retrieval, "_get_client", new_callable=mock.AsyncMock):
+                with mock.patch.object(retrieval, "_fetch_feed", fake_fetch_feed):
+                    results = await asyncio.wait_for(
+                        retrieval.fetch_rss_articles("scaling", max_articles=2),
+                        timeout=1,
+                    )
+
+        self.assertTrue(cancelled.is_set())
+        self.assertEqual(
+            [item.url for item in results], ["https://lab.org/a", "https://lab.org/b"]
+        )
+
+
+class ArxivParsingTests(TestCase):
+    def test_parse_arxiv_feed_extracts_entries(self) -> None:
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom">
+              <entry>
+                <title> Sparse Attention </title>
+                <summary> We study sparsity. </summary>
+                <published>2024-03-01T00:00:00Z</published>
+                <updated>2024-03-02T12:30:00Z</updated>
+                <link href="https://arxiv.org/abs/1" rel="alternate" type="text/html"/>
+                <author><name>Ada</name></author>
+                <author><name>Alan</name></author>
+              </entry>
+              <entry>
+                <title>Second Paper</title>
+                <updated>2024-03-01T00:00:00Z</updated>
+              </entry>
+            </feed>
+        """
+
+        results = retrieval._parse_arxiv_feed(feed, max_results=1)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].title, "Sparse Attention")
+        self.assertEqual(results[0].url, "https://arxiv.org/abs/1")
+        self.assertEqual(results[0].published_at, "2024-03-02 12:30 UTC")
+        self.assertEqual(results[0].metadata["authors"], ["Ada", "Alan"])
+
+
+class FeedParsingTests(TestCase):
+    def test_fast_rss_parse_reads_atom_entries(self) -> None:
+        feed = b"""<?xml version="1.0" encoding="utf-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom">
+              <title>Research Blog</title>
+              <entry>
+                <title>Gemini Update</title>
+                <link rel="self" href="https://blog.example/self"/>
+                <link href="https://blog.example/gemini"/>
+                <updated>2024-05-01T10:00:00Z</updated>
+                <content type="html">&lt;p&gt;Details&lt;/p&gt;</content>
+              </entry>
+            </feed>
+        """
+
+        feed_title, entries = retrieval._fast_rss_parse(feed)
+
+        self.assertEqual(feed_title, "Research Blog")
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["link"], "https://blog.example/gemini")
+        self.assertEqual(entries[0]["content"], [{"value": "<p>Details</p>"}])
+        self.assertEqual(entries[0]["updated"], "2024-05-01T10:00:00Z")
+
+    def test_fast_rss_parse_rejects_unknown_roots(self) -> None:
+        with self.assertRaises(ValueError):
+            retrieval._fast_rss_parse(b"<html><body/></html>")
+
+
+class UrlNormalizationTests(TestCase):
+    def test_normalize_url_drops_tracking_params_and_fragments(self) -> None:
+        variants = [
+            "https://Example.org/post/?utm_source=rss&id=7#comments",
+            "HTTPS://example.org/post?id=7&fbclid=abc",
+            "https://example.org/post?ref=newsletter&id=7",
+        ]
+
+        normalized = {retrieval._normalize_url(url) for url in variants}
+
+        self.assertEqual(normalized, {"https://example.org/post?id=7"})
+
+
+class GithubReleaseTests(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        retrieval._cache.clear()
+        retrieval._github_search_cache.clear()
+        retrieval._github_release_cache.clear()
+
+    async def test_fetch_github_releases_skips_missing_and_failed_repos(self) -> None:
+        search = {
+            "items": [
+                {"owner": {"login": "org"}, "name": name, "full_name": f"org/{name}"}
+                for name in ("alpha", "beta", "gamma")
+            ]
+        }
+        release = {
+            "name": "v1.0",
+            "body": "Changelog",
+            "html_url": "https://github.com/org/alpha/releases/v1.0",
+            "published_at": "2024-04-01T00:00:00Z",
+            "tag_name": "v1.0",
+        }
+
+        async def fake_get(_client, url, **_):
+            if url.endswith("/search/repositories"):
+                return SimpleNamespace(
+                    status_code=200,
+                    content=json.dumps(search).encode(),
+                    raise_for_status=lambda: None,
+                )
+            if "/alpha/" in url:
+                return SimpleNamespace(
+                    status_code=200,
+                    content=json.dumps(release).encode(),
+                    headers={},
+                    raise_for_status=lambda: None,
+                )
+            if "/beta/" in url:
+                return SimpleNamespace(status_code=404, content=b"")
+            raise RuntimeError("connection reset")
+
+        with mock.patch.object(retrieval, "_get_client", new_callable=mock.AsyncMock):
+            with mock.patch.object(retrieval, "_get", side_effect=fake_get):
+                results = await retrieval.fetch_github_releases("agents", max_repos=3)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].source, "org/alpha")
+        self.assertEqual(results[0].metadata["tag_name"], "v1.0")
+        self.assertEqual(results[0].published_at, "2024-04-01 00:00 UTC")
+
+    async def test_fetch_github_releases_reuses_search_and_revalidates_releases(
+        self,
+    ) -> None:
+        search = {"items": [{"owner": {"login": "org"}, "name": "alpha"}]}
+        release = {"name": "v2.0", "published_at": "2024-05-01T00:00:00Z"}
+        calls = []
+
+        async def fake_get(_client, url, headers=None, **_):
+            calls.append((url, dict(headers or {})))
+            if url.endswith("/search/repositories"):
+                return SimpleNamespace(
+                    status_code=200,
+                    content=json.dumps(search).encode(),
+                    raise_for_status=lambda: None,
+                )
+            if "If-None-Match" in headers:
+                return SimpleNamespace(status_code=304, content=b"", headers={})
+            return SimpleNamespace(
+                status_code=200,
+                content=json.dumps(release).encode(),
+                headers={"etag": '"r1"'},
+                raise_for_status=lambda: None,
+            )
+
+        with mock.patch.object(retrieval, "_get_client", new_callable=mock.AsyncMock):
+            with mock.patch.object(retrieval, "_get", side_effect=fake_get):
+                first = await retrieval.fetch_github_releases("agents", max_repos=1)
+                retrieval._cache.clear()
+                second = await retrieval.fetch_github_releases("agents", max_repos=1)
+
+        searches = [url for url, _ in calls if url.endswith("/search/repositories")]
+        self.assertEqual(len(searches), 1)
+        self.assertEqual(calls[-1][1]["If-None-Match"], '"r1"')
+        self.assertEqual([item.title for item in second], ["v2.0"])
+        self.assertEqual(second, first)
+
+
+class ConditionalFeedFetchTests(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        retrieval._feed_cache.clear()
+
+    async def test_fetch_feed_revalidates_and_reuses_cached_parse(self) -> None:
+        feed = b"""
+            <rss version="2.0"><channel><title>Blog</title>
+              <item><title>Post</title><link>https://blog.org/p</link></item>
+            </channel></rss>
+        """
+        fresh = SimpleNamespace(
+            status_code=200, content=feed, headers={"etag": '"v1"'}
+        )
+        not_modified = SimpleNamespace(status_code=304, content=b"", headers={})
+        fake_get = mock.AsyncMock(side_effect=[fresh, not_modified])
+
+        with mock.patch.object(retrieval, "_get", fake_get):
+            first = await retrieval._fetch_feed(None, "https://blog.org/rss", "RSS feed")
+            second = await retrieval._fetch_feed(None, "https://blog.org/rss", "RSS feed")
+
+        self.assertIs(second, first)
+        self.assertEqual(first[0], "Blog")
+        revalidation_headers = fake_get.await_args_list[1].kwargs["headers"]
+        self.assertEqual(revalidation_headers["If-None-Match"], '"v1"')
+
+    async def test_fetch_feed_evicts_least_recently_used_entries(self) -> None:
+        feed = b"<rss version='2.0'><channel><title>Blog</title></channel></rss>"
+        response = SimpleNamespace(status_code=200, content=feed, headers={"etag": "x"})
+
+        with mock.patch.object(retrieval, "_FEED_CACHE_MAX_ENTRIES", 2):
+            with mock.patch.object(
+                retrieval, "_get", new_callable=mock.AsyncMock, return_value=response
+            ):
+                for host in ("a", "b", "c"):
+                    await retrieval._fetch_feed(None, f"https://{host}.org/rss", "RSS")
+
+        self.assertEqual(
+            list(retrieval._feed_cache), ["https://b.org/rss", "https://c.org/rss"]
+        )
+
+
+class QueryPrefixCacheTests(TestCase):
+    def setUp(self) -> None:
+        retrieval._query_prefix_cache.clear()
+
+    def test_follow_up_query_is_filtered_from_broader_cached_results(self) -> None:
+        items = [
+            retrieval._build_context_item(
+                provider="arxiv",
+                source="arXiv",
+                title=title,
+                summary="",
+                url=f"https://arxiv.org/{idx}",
+                published_at="2024-01-01 00:00 UTC",
+                content="",
+            )
+            for idx, title in enumerate(
+                ["Transformer scaling laws", "Scaling transformer depth", "Vision"]
+            )
+        ]
+        broad = retrieval._query_tokens("the transformer architecture")
+        retrieval._remember_context(broad, items, limit=3)
+
+        follow_up = retrieval._query_tokens("Transformer architecture scaling")
+        reused = retrieval._reuse_cached_context(follow_up, limit=2)
+        too_narrow = retrieval._reuse_cached_context(follow_up, limit=3)
+
+        self.assertEqual(reused, items[:2])
+        self.assertIsNot(reused[0], retrieval._query_prefix_cache[broad][1][0])
+        self.assertIsNone(too_narrow)
+
+    def test_follow_up_tokens_must_match_whole_words(self) -> None:
+        items = [
+            retrieval._build_context_item(
+                provider="newsapi",
+                source="Wire",
+                title=title,
+                summary="",
+                url=f"https://example.org/{idx}",
+                published_at="2024-01-01 00:00 UTC",
+                content="",
+            )
+            for idx, title in enumerate(["Python training tips", "Python main loop"])
+        ]
+        retrieval._remember_context(retrieval._query_tokens("python"), items, limit=2)
+
+        follow_up = retrieval._query_tokens("python ai")
+
+        self.assertIsNone(retrieval._reuse_cached_context(follow_up, limit=1))
+
+    def test_short_aggregates_are_neither_stored_nor_replayed(self) -> None:
+        item = retrieval._build_context_item(
+            provider="newsapi",
+            source="Wire",
+            title="Only story",
+            summary="",
+            url="https://example.org/only",
+            published_at="2024-01-01 00:00 UTC",
+            content="",
+        )
+        tokens = retrieval._query_tokens("agents")
+
+        retrieval._remember_context(tokens, [item], limit=2)
+        self.assertNotIn(tokens, retrieval._query_prefix_cache)
+
+        retrieval._remember_context(tokens, [item], limit=1)
+        self.assertIsNone(retrieval._reuse_cached_context(tokens, limit=2))
+        self.assertEqual(retrieval._reuse_cached_context(tokens, limit=1), [item])
+
+
+class SharedClientTests(TestCase):
+    def test_get_client_is_reused_within_a_loop_but_not_across_loops(self) -> None:
+        async def grab_twice():
+            return await retrieval._get_client(), await retrieval._get_client()
+
+        fake_httpx = SimpleNamespace(
+            AsyncClient=lambda **_: SimpleNamespace(is_closed=False),
+            Limits=lambda **_: None,
+        )
+        with mock.patch.object(retrieval, "httpx", fake_httpx):
+            first, again = asyncio.run(grab_twice())
+            other, _ = asyncio.run(grab_twice())
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+
+    def test_get_host_limits_survive_a_new_event_loop(self) -> None:
+        async def fake_get(url, **_):
+            await asyncio.sleep(0)
+            return SimpleNamespace(status_code=200)
+
+        client = SimpleNamespace(get=fake_get)
+
+        async def contended_gets():
+            # Two requests against a limit of one force the second to wait,
+            # which binds the host's semaphore to the running loop
+            return await asyncio.gather(
+                retrieval._get(client, "https://busy.org/a"),
+                retrieval._get(client, "https://busy.org/b"),
+            )
+
+        with mock.patch.object(retrieval, "_HOST_CONCURRENCY", 1):
+            first = asyncio.run(contended_gets())
+            second = asyncio.run(contended_gets())
+
+        self.assertEqual([r.status_code for r in first + second], [200] * 4)
+
+
+class HostConcurrencyTests(IsolatedAsyncioTestCase):
+    async def test_get_caps_concurrency_per_host_only(self) -> None:
+        in_flight: dict = {}
+        peak: dict = {}
+
+        async def fake_get(url, **_):
+            host = url.split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return SimpleNamespace(status_code=200)
+
+        client = SimpleNamespace(get=fake_get)
+        urls = [f"https://slow.org/{idx}" for idx in range(4)]
+        urls += [f"https://fast.org/{idx}" for idx in range(4)]
+        with mock.patch.object(retrieval, "_HOST_CONCURRENCY", 2):
+            await asyncio.gather(*[retrieval._get(client, url) for url in urls])
+
+        self.assertEqual(peak, {"slow.org": 2, "fast.org": 2})